@@ -9,27 +9,48 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import difflib
+import functools
 import html
 import json
+import mmap
 import os
-import subprocess
+import re
 import sys
-import tempfile
-from dataclasses import dataclass, field
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+)
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json works too.
+    orjson = None  # type: ignore[assignment]
+
+# orjson turns integers outside the 64-bit range into floats. Any such literal
+# has at least 19 digits, so lines holding a run that long (rare) are decoded
+# with stdlib json, which keeps every digit. (The [0-9][0-9]{18} spelling scans
+# noticeably faster in re than [0-9]{19,}.)
+_WIDE_INT_BYTES = re.compile(rb"[0-9][0-9]{18}")
+_WIDE_INT_TEXT = re.compile(r"[0-9][0-9]{18}")
+
+if orjson is not None:
+    def _loads(data: Union[bytes, str]) -> Any:
+        if isinstance(data, bytes):
+            wide = _WIDE_INT_BYTES.search(data) is not None
+        else:
+            wide = _WIDE_INT_TEXT.search(data) is not None
+        return json.loads(data) if wide else orjson.loads(data)
 
-
-@dataclass
-class Entry:
-    timestamp: str
-    label: str
-    body_html: str
-    css_class: str
-    raw_type: str
-    lineno: int
-    extra_classes: List[str] = field(default_factory=list)
+    _JsonError = (json.JSONDecodeError, orjson.JSONDecodeError, UnicodeDecodeError)
+else:
+    _loads = json.loads
+    # stdlib json decodes bytes itself and raises UnicodeDecodeError on bad UTF-8.
+    _JsonError = (json.JSONDecodeError, UnicodeDecodeError)
 
 
 @dataclass
@@ -42,6 +63,30 @@ class RunCodeUpload:
 
 
 TARGET_RUN_CODE_FN = "mcp__kernelmcp__vm_compile_c_and_upload"
+# Only lines containing this can hold an upload, so the others skip extraction.
+RUN_CODE_NEEDLE = TARGET_RUN_CODE_FN.encode("utf-8")
+
+# A decoded JSON object; values are whatever the log happened to contain.
+JsonObject = Dict[str, Any]
+
+# Collapsed payloads by line number; they are only rendered when a card is opened.
+Deferred = Dict[int, object]
+
+# Function outputs longer than this (in characters) are shown as raw text.
+MAX_STRUCTURED_OUTPUT = 1024 * 1024
+
+# Message content item types that carry displayable text.
+_TEXT_TYPES = frozenset(("input_text", "output_text"))
+
+
+def positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
 
 
 def parse_args() -> argparse.Namespace:
@@ -60,73 +105,164 @@ def parse_args() -> argparse.Namespace:
         default=8000,
         help="Port to bind the HTTP server (default: 8000).",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Worker processes for parsing large logs "
+        "(default: all available CPUs; 1 disables the pool).",
+    )
     return parser.parse_args()
 
 
-def load_entries(path: Path) -> List[Entry]:
-    entries: List[Entry] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for lineno, line in enumerate(handle, 1):
-            line = line.strip()
-            if not line:
+# Logs smaller than this are parsed in-process; worker startup would dominate.
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+
+def load_log(
+    path: Path, jobs: Optional[int] = None
+) -> Tuple[List[str], List[RunCodeUpload], Deferred]:
+    # Single pass: each line is decoded once and feeds both pages.
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return [], [], {}
+        if jobs is None:
+            jobs = available_cpus()
+        if size < PARALLEL_MIN_BYTES or jobs < 2:
+            return load_log_range(str(path), 0, size, 1)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = split_line_ranges(data, jobs)
+    # Ranges end on line boundaries and come back in order, so concatenating
+    # the per-range results reproduces the sequential parse.
+    entries: List[str] = []
+    uploads: List[RunCodeUpload] = []
+    deferred: Deferred = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(load_log_range, str(path), *bounds) for bounds in ranges]
+        for future in futures:
+            part_entries, part_uploads, part_deferred = future.result()
+            entries.extend(part_entries)
+            deferred.update(part_deferred)
+            for upload in part_uploads:
+                upload.index = len(uploads) + 1
+                uploads.append(upload)
+    return entries, uploads, deferred
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows.
+        return os.cpu_count() or 1
+
+
+def split_line_ranges(data: mmap.mmap, parts: int) -> List[Tuple[int, int, int]]:
+    """Split the log into (start, end, first lineno) ranges ending on newlines."""
+    size = len(data)
+    ranges: List[Tuple[int, int, int]] = []
+    start = 0
+    lineno = 1
+    for i in range(1, parts + 1):
+        if i == parts:
+            end = size
+        else:
+            newline = data.find(b"\n", max(start, size * i // parts))
+            end = size if newline < 0 else newline + 1
+        if end > start:
+            ranges.append((start, end, lineno))
+            lineno += count_newlines(data, start, end)
+            start = end
+        if start == size:
+            break
+    return ranges
+
+
+def count_newlines(data: mmap.mmap, start: int, end: int) -> int:
+    window = 16 * 1024 * 1024
+    return sum(
+        data[pos:min(pos + window, end)].count(b"\n")
+        for pos in range(start, end, window)
+    )
+
+
+def load_log_range(
+    path: str,
+    start: int,
+    end: int,
+    lineno: int,
+) -> Tuple[List[str], List[RunCodeUpload], Deferred]:
+    entries: List[str] = []
+    uploads: List[RunCodeUpload] = []
+    deferred: Deferred = {}
+    with open(path, "rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        for lineno, line in iter_lines(data, start, end, lineno):
+            # The parser skips surrounding whitespace (including a trailing
+            # \r) itself. Records are objects, so a line that opens with "{"
+            # needs no blank-line check at all.
+            if line[:1] != b"{" and (not line or line.isspace()):
                 continue
             try:
-                record = json.loads(line)
-            except json.JSONDecodeError as exc:
-                entries.append(
-                    Entry(
-                        timestamp="n/a",
-                        label="Malformed JSON",
-                        body_html=f"<pre>{html.escape(str(exc))}</pre>",
-                        css_class="entry-error",
-                        raw_type="error",
-                        lineno=lineno,
-                    )
-                )
+                record = _loads(line)
+            except _JsonError as exc:
+                entries.append(malformed_entry(str(exc), lineno))
+                continue
+            if not isinstance(record, dict):
+                entries.append(malformed_entry("Expected a JSON object", lineno))
                 continue
-            entry = convert_record(record, lineno)
+            entry = convert_record(record, lineno, deferred)
             if entry:
                 entries.append(entry)
-    return entries
+            if RUN_CODE_NEEDLE in line:
+                upload = extract_run_code_upload(record, lineno, len(uploads) + 1)
+                if upload:
+                    uploads.append(upload)
+    return entries, uploads, deferred
+
+
+def malformed_entry(message: str, lineno: int) -> str:
+    return make_article(
+        timestamp="n/a",
+        label="Malformed JSON",
+        body_html=f"<pre>{_escape_text(message)}</pre>",
+        css_class="entry-error",
+        raw_type="error",
+        lineno=lineno,
+    )
 
 
-def convert_record(record: dict, lineno: int) -> Optional[Entry]:
+def iter_lines(
+    data: mmap.mmap,
+    start: int,
+    end: int,
+    lineno: int,
+) -> Iterator[Tuple[int, bytes]]:
+    # Newlines are located with mmap.find, so the file is never pushed through
+    # Python-level buffered line reading.
+    find = data.find
+    while start < end:
+        stop = find(b"\n", start, end)
+        if stop < 0:
+            stop = end
+        yield lineno, data[start:stop]
+        lineno += 1
+        start = stop + 1
+
+
+def convert_record(record: JsonObject, lineno: int, deferred: Deferred) -> Optional[str]:
     rectype = record.get("type", "unknown")
-    timestamp = record.get("timestamp", "unknown")
     payload = record.get("payload", {})
-
-    if rectype == "session_meta":
-        body = format_payload(payload, collapsed=True)
-        return Entry(
-            timestamp=timestamp,
-            label="Session metadata",
-            body_html=body,
-            css_class="entry-system",
-            raw_type=rectype,
-            lineno=lineno,
-        )
-
-    if rectype == "turn_context":
-        body = format_payload(payload, collapsed=True)
-        return Entry(
-            timestamp=timestamp,
-            label="Turn context",
-            body_html=body,
-            css_class="entry-system",
-            raw_type=rectype,
-            lineno=lineno,
-            extra_classes=["collapsible-meta"],
-        )
-
-    if rectype == "response_item":
-        return convert_response_item(record, lineno)
-
-    if rectype == "event_msg":
-        return convert_event_msg(record, lineno)
+    timestamp = record.get("timestamp", "unknown")
+    handler = _RECORD_HANDLERS.get(rectype)
+    if handler is not None:
+        return handler(payload, timestamp, lineno, deferred)
 
     # Unknown type, display raw payload for debugging.
     fallback = format_payload(payload)
-    return Entry(
+    return make_article(
         timestamp=timestamp,
         label=f"Unhandled type: {rectype}",
         body_html=fallback,
@@ -136,95 +272,45 @@ def convert_record(record: dict, lineno: int) -> Optional[Entry]:
     )
 
 
-def convert_response_item(record: dict, lineno: int) -> Optional[Entry]:
-    payload = record.get("payload") or {}
-    subtype = payload.get("type")
-    timestamp = record.get("timestamp", "unknown")
-    role = payload.get("role", "n/a")
+def _convert_session_meta(
+    payload: Any, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    body = defer_payload(payload, lineno, deferred)
+    return make_article(
+        timestamp=timestamp,
+        label="Session metadata",
+        body_html=body,
+        css_class="entry-system",
+        raw_type="session_meta",
+        lineno=lineno,
+    )
 
-    if subtype == "message":
-        texts = extract_text_chunks(payload.get("content") or [])
-        if not texts:
-            return None
-        text_html = "<hr>".join(format_text_block(t) for t in texts)
-        css = "entry-user" if role == "user" else "entry-assistant"
-        return Entry(
-            timestamp=timestamp,
-            label=f"Message · {role}",
-            body_html=text_html,
-            css_class=css,
-            raw_type="response_item/message",
-            lineno=lineno,
-        )
 
-    if subtype == "function_call":
-        name = payload.get("name", "unknown")
-        args = payload.get("arguments") or ""
-        call_id = payload.get("call_id", "n/a")
-        parsed_args = try_parse_json(args)
-        plan_html = render_plan_board(
-            parsed_args) if name == "update_plan" else None
-        args_html = ""
-        if parsed_args is not None:
-            args_html = render_structured_data(parsed_args)
-        elif args:
-            args_html = format_pre(args)
-        body = (
-            f"<div><strong>Call:</strong> {html.escape(name)}</div>"
-            f"<div><strong>call_id:</strong> {html.escape(call_id)}</div>"
-        )
-        if plan_html:
-            body += plan_html
-        if args_html:
-            body += args_html
-        return Entry(
-            timestamp=timestamp,
-            label="Function call",
-            body_html=body,
-            css_class="entry-tool",
-            raw_type="response_item/function_call",
-            lineno=lineno,
-        )
+def _convert_turn_context(
+    payload: Any, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    body = defer_payload(payload, lineno, deferred)
+    return make_article(
+        timestamp=timestamp,
+        label="Turn context",
+        body_html=body,
+        css_class="entry-system",
+        raw_type="turn_context",
+        lineno=lineno,
+        extra_classes=("collapsible-meta",),
+    )
 
-    if subtype == "function_call_output":
-        call_id = payload.get("call_id", "n/a")
-        output = payload.get("output")
-        parsed_output = try_parse_json(output)
-        if parsed_output is not None:
-            output_html = render_structured_data(parsed_output)
-        elif output is None:
-            output_html = "<em>no output</em>"
-        else:
-            output_html = render_scalar(output)
-        body = f"<div><strong>call_id:</strong> {html.escape(call_id)}</div>{output_html}"
-        return Entry(
-            timestamp=timestamp,
-            label="Function output",
-            body_html=body,
-            css_class="entry-tool",
-            raw_type="response_item/function_call_output",
-            lineno=lineno,
-        )
 
-    if subtype == "reasoning":
-        summary = payload.get("summary") or []
-        if summary:
-            summary_html = "<ul>" + "".join(
-                f"<li>{render_reasoning_summary_item(item)}</li>" for item in summary
-            ) + "</ul>"
-        else:
-            summary_html = "<em>No public summary (content encrypted)</em>"
-        return Entry(
-            timestamp=timestamp,
-            label="Reasoning note",
-            body_html=summary_html,
-            css_class="entry-assistant",
-            raw_type="response_item/reasoning",
-            lineno=lineno,
-            extra_classes=["collapsible-meta"],
-        )
+def convert_response_item(
+    payload: Any, timestamp: str, lineno: int, deferred: Deferred
+) -> Optional[str]:
+    payload = payload or {}
+    subtype = payload.get("type")
+    handler = _RESPONSE_HANDLERS.get(subtype) if isinstance(subtype, str) else None
+    if handler is not None:
+        return handler(payload, timestamp, lineno, deferred)
 
-    return Entry(
+    return make_article(
         timestamp=timestamp,
         label=f"Response item ({subtype or 'unknown'})",
         body_html=format_payload(payload),
@@ -234,42 +320,117 @@ def convert_response_item(record: dict, lineno: int) -> Optional[Entry]:
     )
 
 
-def convert_event_msg(record: dict, lineno: int) -> Entry:
-    payload = record.get("payload") or {}
-    subtype = payload.get("type")
-    timestamp = record.get("timestamp", "unknown")
+def _convert_message(
+    payload: JsonObject, timestamp: str, lineno: int, deferred: Deferred
+) -> Optional[str]:
+    role = payload.get("role", "n/a")
+    texts = extract_text_chunks(payload.get("content") or [])
+    if not texts:
+        return None
+    text_html = "<hr>".join(format_text_block(t) for t in texts)
+    css = "entry-user" if role == "user" else "entry-assistant"
+    return make_article(
+        timestamp=timestamp,
+        label=f"Message · {role}",
+        body_html=text_html,
+        css_class=css,
+        raw_type="response_item/message",
+        lineno=lineno,
+    )
 
-    if subtype in {"user_message", "agent_message"}:
-        message = payload.get("message", "")
-        kind = payload.get("kind", "plain")
-        css = "entry-user" if subtype == "user_message" else "entry-assistant"
-        body = (
-            f"<div><strong>Kind:</strong> {html.escape(kind)}</div>"
-            f"{format_pre(message)}"
-        )
-        return Entry(
-            timestamp=timestamp,
-            label=f"Event · {subtype}",
-            body_html=body,
-            css_class=css,
-            raw_type=f"event_msg/{subtype}",
-            lineno=lineno,
-        )
 
-    if subtype == "token_count":
-        info = payload.get("info") or {}
-        body = format_payload(info, collapsed=True)
-        return Entry(
-            timestamp=timestamp,
-            label="Token usage",
-            body_html=body,
-            css_class="entry-metric",
-            raw_type="event_msg/token_count",
-            lineno=lineno,
-            extra_classes=["collapsible-meta"],
-        )
+def _convert_function_call(
+    payload: JsonObject, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    name = payload.get("name", "unknown")
+    args = payload.get("arguments") or ""
+    call_id = payload.get("call_id", "n/a")
+    parsed_args = try_parse_json(args)
+    plan_html = render_plan_board(
+        parsed_args) if name == "update_plan" else None
+    args_html = ""
+    if parsed_args is not None:
+        args_html = render_structured_data(parsed_args)
+    elif args:
+        args_html = format_pre(args)
+    parts = [
+        f"<div><strong>Call:</strong> {_esc(name)}</div>",
+        f"<div><strong>call_id:</strong> {_esc(call_id)}</div>",
+    ]
+    if plan_html:
+        parts.append(plan_html)
+    if args_html:
+        parts.append(args_html)
+    return make_article(
+        timestamp=timestamp,
+        label="Function call",
+        body_html="".join(parts),
+        css_class="entry-tool",
+        raw_type="response_item/function_call",
+        lineno=lineno,
+    )
+
+
+def _convert_function_call_output(
+    payload: JsonObject, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    call_id = payload.get("call_id", "n/a")
+    output = payload.get("output")
+    if isinstance(output, str) and len(output) > MAX_STRUCTURED_OUTPUT:
+        # A huge nested table renders slower than the raw text and is harder to read.
+        parsed_output = None
+    else:
+        parsed_output = try_parse_json(output)
+    if parsed_output is not None:
+        output_html = render_structured_data(parsed_output)
+    elif output is None:
+        output_html = "<em>no output</em>"
+    else:
+        output_html = render_scalar(output)
+    body = f"<div><strong>call_id:</strong> {_esc(call_id)}</div>{output_html}"
+    return make_article(
+        timestamp=timestamp,
+        label="Function output",
+        body_html=body,
+        css_class="entry-tool",
+        raw_type="response_item/function_call_output",
+        lineno=lineno,
+    )
+
+
+def _convert_reasoning(
+    payload: JsonObject, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    summary = payload.get("summary") or []
+    if summary:
+        parts = ["<ul>"]
+        for item in summary:
+            parts.append(f"<li>{render_reasoning_summary_item(item)}</li>")
+        parts.append("</ul>")
+        summary_html = "".join(parts)
+    else:
+        summary_html = "<em>No public summary (content encrypted)</em>"
+    return make_article(
+        timestamp=timestamp,
+        label="Reasoning note",
+        body_html=summary_html,
+        css_class="entry-assistant",
+        raw_type="response_item/reasoning",
+        lineno=lineno,
+        extra_classes=("collapsible-meta",),
+    )
+
+
+def convert_event_msg(
+    payload: Any, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    payload = payload or {}
+    subtype = payload.get("type")
+    handler = _EVENT_HANDLERS.get(subtype) if isinstance(subtype, str) else None
+    if handler is not None:
+        return handler(payload, timestamp, lineno, deferred)
 
-    return Entry(
+    return make_article(
         timestamp=timestamp,
         label=f"Event ({subtype or 'unknown'})",
         body_html=format_payload(payload),
@@ -279,20 +440,121 @@ def convert_event_msg(record: dict, lineno: int) -> Entry:
     )
 
 
-def extract_text_chunks(content_items: Iterable[dict]) -> List[str]:
+def _convert_chat_event(
+    payload: JsonObject, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    subtype = payload["type"]
+    message = payload.get("message", "")
+    kind = payload.get("kind", "plain")
+    css = "entry-user" if subtype == "user_message" else "entry-assistant"
+    body = (
+        f"<div><strong>Kind:</strong> {_esc(kind)}</div>"
+        f"{format_pre(message)}"
+    )
+    return make_article(
+        timestamp=timestamp,
+        label=f"Event · {subtype}",
+        body_html=body,
+        css_class=css,
+        raw_type=f"event_msg/{subtype}",
+        lineno=lineno,
+    )
+
+
+def _convert_token_count(
+    payload: JsonObject, timestamp: str, lineno: int, deferred: Deferred
+) -> str:
+    info = payload.get("info") or {}
+    body = defer_payload(info, lineno, deferred)
+    return make_article(
+        timestamp=timestamp,
+        label="Token usage",
+        body_html=body,
+        css_class="entry-metric",
+        raw_type="event_msg/token_count",
+        lineno=lineno,
+        extra_classes=("collapsible-meta",),
+    )
+
+
+# Dispatch tables are looked up once per log line instead of walking if-chains.
+_RECORD_HANDLERS: Dict[str, Callable[[Any, str, int, Deferred], Optional[str]]] = {
+    "session_meta": _convert_session_meta,
+    "turn_context": _convert_turn_context,
+    "response_item": convert_response_item,
+    "event_msg": convert_event_msg,
+}
+
+_RESPONSE_HANDLERS: Dict[str, Callable[[JsonObject, str, int, Deferred], Optional[str]]] = {
+    "message": _convert_message,
+    "function_call": _convert_function_call,
+    "function_call_output": _convert_function_call_output,
+    "reasoning": _convert_reasoning,
+}
+
+_EVENT_HANDLERS: Dict[str, Callable[[JsonObject, str, int, Deferred], str]] = {
+    "user_message": _convert_chat_event,
+    "agent_message": _convert_chat_event,
+    "token_count": _convert_token_count,
+}
+
+
+def make_article(
+    *,
+    timestamp: str,
+    label: str,
+    body_html: str,
+    css_class: str,
+    raw_type: str,
+    lineno: int,
+    extra_classes: Tuple[str, ...] = (),
+) -> str:
+    # Each record is rendered straight to its final <article>; the page only
+    # ever needs the HTML, so no per-entry object outlives the parse.
+    classes = " ".join((css_class, *extra_classes)).strip()
+    return (
+        f'<article class="entry {classes}">'
+        f"<header>"
+        f"<div>{_esc(label)}</div>"
+        f"<small>{_esc(timestamp)} · line {lineno} · {_esc(raw_type)}</small>"
+        f"</header>"
+        f"<div>{body_html}</div>"
+        f"</article>"
+    )
+
+
+def extract_text_chunks(content_items: Iterable[object]) -> List[str]:
     texts: List[str] = []
     for chunk in content_items:
         if not isinstance(chunk, dict):
             continue
-        if chunk.get("type") in {"input_text", "output_text"}:
+        if chunk.get("type") in _TEXT_TYPES:
             text = chunk.get("text")
             if text:
                 texts.append(text)
     return texts
 
 
+def _escape_text(text: str) -> str:
+    # Everything we escape lands in a text node, never an attribute, so quotes
+    # can stay as-is; that skips two replace passes over quote-heavy JSON.
+    # Most text needs no escaping at all, and three "in" scans rule that out
+    # far faster than three replace passes that find nothing.
+    if "&" in text or "<" in text or ">" in text:
+        return html.escape(text, quote=False)
+    return text
+
+
+@functools.lru_cache(maxsize=4096)
+def _esc(text: str) -> str:
+    # Labels, timestamps, call ids, tool names and table keys repeat across
+    # thousands of entries. Only short fields go through here; bodies use
+    # _escape_text so the cache never pins large strings.
+    return _escape_text(text)
+
+
 def format_text_block(text: str) -> str:
-    escaped = html.escape(text)
+    escaped = _escape_text(text)
     return escaped.replace("\n", "<br>")
 
 
@@ -303,24 +565,44 @@ def render_reasoning_summary_item(item: object) -> str:
         if isinstance(kind, str) and text is not None:
             text_value = text if isinstance(text, str) else str(text)
             text_html = format_text_block(text_value)
-            kind_html = html.escape(kind)
+            kind_html = _esc(kind)
             return f"<strong>{kind_html}</strong>: {text_html}"
-    return html.escape(str(item))
+    return _escape_text(str(item))
 
 
-def format_pre(text: str) -> str:
+def format_pre(text: object) -> str:
     if text is None:
         return ""
-    return f"<pre>{html.escape(str(text))}</pre>"
+    return f"<pre>{_escape_text(str(text))}</pre>"
+
+
+def pretty_json(payload: object) -> str:
+    # orjson spells some floats differently from json.dumps (1e21 rather than
+    # 1e+21); the value shown is the same.
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits, which _loads keeps exact, cannot be
+            # encoded by orjson; stdlib json prints them digit for digit.
+            pass
+    return json.dumps(payload, indent=2, ensure_ascii=False)
 
 
-def format_payload(payload: dict, collapsed: bool = False) -> str:
-    pretty = json.dumps(payload, indent=2, ensure_ascii=False)
-    escaped = html.escape(pretty)
-    pre = f"<pre>{escaped}</pre>"
-    if not collapsed:
-        return pre
-    return f"<details><summary>Show payload</summary>{pre}</details>"
+def format_payload(payload: object) -> str:
+    return f"<pre>{_escape_text(pretty_json(payload))}</pre>"
+
+
+def defer_payload(payload: object, lineno: int, deferred: Deferred) -> str:
+    # Only a placeholder goes into the page; the page script fetches
+    # /payload/<lineno> the first time the block is opened.
+    deferred[lineno] = payload
+    return (
+        f'<details data-payload="{lineno}">'
+        "<summary>Show payload</summary><pre></pre></details>"
+    )
 
 
 def try_parse_json(value: object) -> Optional[object]:
@@ -329,45 +611,115 @@ def try_parse_json(value: object) -> Optional[object]:
     if not isinstance(value, str):
         return None
     text = value.strip()
-    if not text:
+    # Only objects and arrays are rendered as structured data; anything else
+    # (plain text, bare numbers) is skipped without invoking the parser.
+    if not text or text[0] not in "{[":
         return None
+    parsed = _parse_cached(text) if len(text) <= PARSE_CACHE_MAX_CHARS else _parse(text)
+    return None if parsed is _UNPARSABLE else parsed
+
+
+# Tool calls often repeat identical argument strings. Only short texts are
+# cached; the parsed values are shared, which is fine since rendering never
+# mutates them.
+PARSE_CACHE_MAX_CHARS = 4096
+_UNPARSABLE = object()
+
+
+def _parse(text: str) -> object:
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        return None
+        parsed: object = _loads(text)
+    except _JsonError:
+        return _UNPARSABLE
+    return parsed
+
+
+_parse_cached = functools.lru_cache(maxsize=1024)(_parse)
 
 
 def render_structured_data(data: object) -> str:
-    if isinstance(data, dict):
-        if data.get("type") == "code":
-            return render_code_block(data)
-        rows = "".join(
-            f"<tr><th>{html.escape(str(key))}</th><td>{render_structured_data(value)}</td></tr>"
-            for key, value in data.items()
-        )
-        return f'<table class="kv-table">{rows}</table>'
-    if isinstance(data, list):
-        items = "".join(
-            f"<li>{render_structured_data(item)}</li>" for item in data)
-        return f'<ul class="list-nested">{items}</ul>'
-    return render_scalar(data)
+    # Iterative walk over an explicit stack of child iterators, so nested
+    # payloads cost no Python frames and cannot hit the recursion limit.
+    parts: List[str] = []
+    append = parts.append
+    # Each frame: (children iterator, is a dict, markup closing the container).
+    frames: List[Tuple[Iterator[Any], bool, str]] = []
+    node: Any = data
+    tail = ""
+    while True:
+        if isinstance(node, dict):
+            if node.get("type") == "code":
+                append(render_code_block(node))
+                append(tail)
+            else:
+                append('<table class="kv-table">')
+                frames.append((iter(node.items()), True, "</table>" + tail))
+        elif isinstance(node, list):
+            append('<ul class="list-nested">')
+            frames.append((iter(node), False, "</ul>" + tail))
+        else:
+            append(render_scalar(node))
+            append(tail)
+        # Emit scalar children in place; stop at the next container to open it.
+        while frames:
+            children, is_dict, closing = frames[-1]
+            for node in children:
+                if is_dict:
+                    key, node = node
+                    append("<tr><th>")
+                    append(_esc(str(key)))
+                    append("</th><td>")
+                    tail = "</td></tr>"
+                else:
+                    append("<li>")
+                    tail = "</li>"
+                if isinstance(node, (dict, list)):
+                    break
+                append(render_scalar(node))
+                append(tail)
+            else:
+                frames.pop()
+                append(closing)
+                continue
+            break
+        else:
+            return "".join(parts)
 
 
 def render_scalar(value: object) -> str:
     if value is None:
         return "<em>null</em>"
     if isinstance(value, str):
-        return format_pre(value) if "\n" in value else f"<span>{html.escape(value)}</span>"
-    return f"<span>{html.escape(str(value))}</span>"
+        return format_pre(value) if "\n" in value else f"<span>{_escape_text(value)}</span>"
+    return f"<span>{_escape_text(str(value))}</span>"
 
 
-def render_code_block(node: dict) -> str:
+def render_code_block(node: JsonObject) -> str:
     code = node.get("code") or node.get("content") or node.get("text") or ""
     code = str(code)
     language = node.get("language") or node.get(
         "lang") or node.get("programming_language")
-    header = f'<div class="code-lang">{html.escape(language)}</div>' if language else ""
-    return f'<div class="code-block">{header}<pre><code>{html.escape(code)}</code></pre></div>'
+    header = f'<div class="code-lang">{_esc(language)}</div>' if language else ""
+    return f'<div class="code-block">{header}<pre><code>{_escape_text(code)}</code></pre></div>'
+
+
+# Plan statuses come from a small closed set: raw status -> (CSS class, label).
+_STATUS_LOOKUP: Dict[str, Tuple[str, str]] = {
+    "in_progress": ("in_progress", "in progress"),
+    "pending": ("pending", "pending"),
+    "completed": ("completed", "completed"),
+    "error": ("error", "error"),
+}
+
+
+def plan_status_parts(status: str) -> Tuple[str, str]:
+    known = _STATUS_LOOKUP.get(status)
+    if known is not None:
+        return known
+    # The class lands inside an attribute, so unlike the label it needs quotes
+    # escaped as well.
+    status_class = html.escape(status.lower().replace(" ", "-"))
+    return status_class, _esc(status.replace("_", " "))
 
 
 def render_plan_board(data: Optional[object]) -> Optional[str]:
@@ -377,20 +729,22 @@ def render_plan_board(data: Optional[object]) -> Optional[str]:
     if not isinstance(plan, list):
         return None
     explanation = data.get("explanation")
-    items = []
+    items: List[str] = []
+    append = items.append
     for item in plan:
         if not isinstance(item, dict):
             continue
-        status = str(item.get("status", "unknown"))
-        status_class = status.lower().replace(" ", "-")
-        step = html.escape(str(item.get("step", "")))
-        items.append(
-            f'<li><span class="status-chip status-{status_class}">{html.escape(status.replace("_", " "))}</span>'
-            f"<span>{step}</span></li>"
-        )
+        status_class, status_label = plan_status_parts(str(item.get("status", "unknown")))
+        append('<li><span class="status-chip status-')
+        append(status_class)
+        append('">')
+        append(status_label)
+        append("</span><span>")
+        append(_escape_text(str(item.get("step", ""))))
+        append("</span></li>")
     if not items:
         return None
-    expl_html = f"<p>{html.escape(str(explanation))}</p>" if explanation else ""
+    expl_html = f"<p>{_escape_text(str(explanation))}</p>" if explanation else ""
     return f'<section class="plan-board"><h4>Plan</h4>{expl_html}<ol>{"".join(items)}</ol></section>'
 
 
@@ -398,8 +752,10 @@ def render_diff(diff_text: str) -> str:
     if not diff_text:
         return "<pre class=\"diff-block\"><span class=\"diff-context\">(no diff)</span></pre>"
     formatted: List[str] = []
-    for line in diff_text.splitlines():
-        escaped = html.escape(line) or "&nbsp;"
+    # Escaping never touches the +/-/@ prefixes used for classification, so the
+    # whole diff is escaped in one call and split afterwards.
+    for line in _escape_text(diff_text).splitlines():
+        escaped = line or "&nbsp;"
         cls = "diff-context"
         if line.startswith("@@"):
             cls = "diff-hunk"
@@ -621,12 +977,6 @@ BASE_CSS = """
     .diff-card pre {
       margin: 0;
     }
-    .error-banner {
-      background: #f8d7da;
-      color: #842029;
-      padding: 0.75rem 1rem;
-      border-radius: 6px;
-    }
     .diff-block {
       background: #0b0d12;
       color: #e6edf3;
@@ -663,10 +1013,9 @@ BASE_CSS = """
 """
 
 
-def build_page(entries: List[Entry], source_path: Path) -> str:
-    cards_html = "\n".join(entry_to_html(entry) for entry in entries)
-    total = len(entries)
-    return f"""<!doctype html>
+# Static page scaffolding is encoded once at import; only the source path,
+# counts and body fragments are encoded per page.
+_INDEX_HEAD = f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
@@ -684,70 +1033,52 @@ def build_page(entries: List[Entry], source_path: Path) -> str:
         <button id="toggle-meta" class="meta-toggle" type="button">Hide meta blocks</button>
       </div>
     </div>
-    <p>Source: {html.escape(str(source_path))} · {total} entries</p>
+    <p>Source: """.encode("utf-8")
+_INDEX_BODY_START = b""" entries</p>
   </header>
   <div class="container">
-    {cards_html}
+    """
+_INDEX_FOOTER = b"""
   </div>
   <script>
-    (() => {{
+    (() => {
       const btn = document.getElementById("toggle-meta");
       if (!btn) return;
       let hidden = false;
-      const update = () => {{
+      const update = () => {
         document.body.classList.toggle("meta-hidden", hidden);
         btn.textContent = hidden ? "Show meta blocks" : "Hide meta blocks";
-      }};
-      btn.addEventListener("click", () => {{
+      };
+      btn.addEventListener("click", () => {
         hidden = !hidden;
         update();
-      }});
+      });
       update();
-    }})();
+    })();
+    (() => {
+      // Collapsed payloads are served separately; fetch each on first open.
+      document.addEventListener("toggle", (event) => {
+        const details = event.target;
+        if (!details.open || !details.dataset.payload || details.dataset.loaded) return;
+        details.dataset.loaded = "1";
+        const pre = details.querySelector("pre");
+        fetch(`/payload/${details.dataset.payload}`)
+          .then((response) => (response.ok ? response.text() : Promise.reject(response.status)))
+          .then((text) => {
+            pre.textContent = text;
+          })
+          .catch(() => {
+            pre.textContent = "Failed to load payload.";
+            delete details.dataset.loaded;
+          });
+      }, true);
+    })();
   </script>
 </body>
 </html>
 """
 
-
-def entry_to_html(entry: Entry) -> str:
-    classes = " ".join([entry.css_class, *entry.extra_classes]).strip()
-    return (
-        f'<article class="entry {classes}">'
-        f"<header>"
-        f"<div>{html.escape(entry.label)}</div>"
-        f"<small>{html.escape(entry.timestamp)} · line {entry.lineno} · {html.escape(entry.raw_type)}</small>"
-        f"</header>"
-        f"<div>{entry.body_html}</div>"
-        f"</article>"
-    )
-
-
-def build_run_code_page(source_path: Path) -> str:
-    uploads = extract_run_code_uploads(source_path)
-    total = len(uploads)
-    summary_section = render_upload_summary(uploads)
-    diffs_section = ""
-    if uploads:
-        try:
-            diffs = build_upload_git_history(uploads)
-        except RuntimeError as exc:
-            diffs_section = (
-                "<section class='panel'>"
-                "<h2>Commit diffs</h2>"
-                f"<div class='error-banner'>Failed to build git history: {html.escape(str(exc))}</div>"
-                "</section>"
-            )
-        else:
-            diff_cards = "".join(
-                f"<div class='diff-card'><h3>{html.escape(label)}</h3>{render_diff(diff)}</div>"
-                for label, diff in diffs
-            )
-            diffs_section = f"<section class='panel'><h2>Commit diffs</h2>{diff_cards}</section>"
-    else:
-        diffs_section = ""
-
-    return f"""<!doctype html>
+_RUN_CODE_HEAD = f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
@@ -764,16 +1095,78 @@ def build_run_code_page(source_path: Path) -> str:
         <a href="/index.html" class="nav-button secondary">Back to entries</a>
       </div>
     </div>
-    <p>Source: {html.escape(str(source_path))} · {total} uploads</p>
+    <p>Source: """.encode("utf-8")
+_RUN_CODE_BODY_START = b""" uploads</p>
   </header>
   <div class="container">
-    {summary_section}
-    {diffs_section}
+    """
+_RUN_CODE_FOOTER = b"""
   </div>
 </body>
 </html>
 """
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def build_page(entries: List[str], source_path: Path) -> List[bytes]:
+    # The page is kept as ~64 KiB byte chunks so neither a full HTML str nor a
+    # second encoded copy of it is ever materialized, and the server can drain
+    # the socket between chunks.
+    chunks = [build_page_header(source_path, len(entries))]
+    chunks.extend(coalesce_chunks(iter_entry_html(entries), STREAM_CHUNK_SIZE))
+    chunks.append(_INDEX_FOOTER)
+    return chunks
+
+
+def build_page_header(source_path: Path, total: int) -> bytes:
+    return b"".join([
+        _INDEX_HEAD,
+        f"{_escape_text(str(source_path))} · {total}".encode("utf-8"),
+        _INDEX_BODY_START,
+    ])
+
+
+def iter_entry_html(entries: Iterable[str]) -> Iterator[bytes]:
+    separator = ""
+    for entry in entries:
+        yield (separator + entry).encode("utf-8")
+        separator = "\n"
+
+
+def coalesce_chunks(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    pending: List[bytes] = []
+    pending_len = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_len += len(chunk)
+        if pending_len >= size:
+            yield b"".join(pending)
+            pending = []
+            pending_len = 0
+    if pending:
+        yield b"".join(pending)
+
+
+def build_run_code_page(uploads: List[RunCodeUpload], source_path: Path) -> List[bytes]:
+    total = len(uploads)
+    summary_section = render_upload_summary(uploads)
+    diffs_section = ""
+    if uploads:
+        diff_cards = "".join(
+            f"<div class='diff-card'><h3>{_escape_text(label)}</h3>{render_diff(diff)}</div>"
+            for label, diff in compute_upload_diffs(uploads)
+        )
+        diffs_section = f"<section class='panel'><h2>Upload diffs</h2>{diff_cards}</section>"
+
+    return [
+        _RUN_CODE_HEAD,
+        f"{_escape_text(str(source_path))} · {total}".encode("utf-8"),
+        _RUN_CODE_BODY_START,
+        f"{summary_section}\n    {diffs_section}".encode("utf-8"),
+        _RUN_CODE_FOOTER,
+    ]
+
 
 def render_upload_summary(uploads: List[RunCodeUpload]) -> str:
     if not uploads:
@@ -787,20 +1180,20 @@ def render_upload_summary(uploads: List[RunCodeUpload]) -> str:
     for upload in uploads:
         code_details = (
             f"<details><summary>{len(upload.code)} chars</summary>"
-            f"<pre>{html.escape(upload.code)}</pre></details>"
+            f"<pre>{_escape_text(upload.code)}</pre></details>"
             if upload.code
             else "<em>empty</em>"
         )
         flags_details = (
             f"<details><summary>{len(upload.flags)} chars</summary>"
-            f"<pre>{html.escape(upload.flags)}</pre></details>"
+            f"<pre>{_escape_text(upload.flags)}</pre></details>"
             if upload.flags
             else "<em>empty</em>"
         )
         rows.append(
             "<tr>"
             f"<td>{upload.index}</td>"
-            f"<td>{html.escape(upload.timestamp)}</td>"
+            f"<td>{_esc(upload.timestamp)}</td>"
             f"<td>line {upload.lineno}</td>"
             f"<td>{code_details}</td>"
             f"<td>{flags_details}</td>"
@@ -815,129 +1208,266 @@ def render_upload_summary(uploads: List[RunCodeUpload]) -> str:
     return f"<section class='panel'><h2>Captured uploads ({len(uploads)})</h2>{table}</section>"
 
 
-def extract_run_code_uploads(source_path: Path) -> List[RunCodeUpload]:
-    uploads: List[RunCodeUpload] = []
-    with source_path.open("r", encoding="utf-8") as handle:
-        for lineno, line in enumerate(handle, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if record.get("type") != "response_item":
-                continue
-            payload = record.get("payload") or {}
-            if payload.get("type") != "function_call":
-                continue
-            if payload.get("name") != TARGET_RUN_CODE_FN:
-                continue
-            args_raw = payload.get("arguments")
-            args = try_parse_json(args_raw)
-            if not isinstance(args, dict):
-                continue
-            code_value = args.get("code", "")
-            code_str = str("" if code_value is None else code_value)
-            flags_value = args.get("flags", "")
-            if isinstance(flags_value, (list, tuple)):
-                flags_str = "\n".join(str(item) for item in flags_value)
-            else:
-                flags_str = "" if flags_value is None else str(flags_value)
-            uploads.append(
-                RunCodeUpload(
-                    index=len(uploads) + 1,
-                    timestamp=record.get("timestamp", "unknown"),
-                    lineno=lineno,
-                    code=code_str,
-                    flags=str(flags_str),
-                )
-            )
-    return uploads
+def extract_run_code_upload(record: JsonObject, lineno: int, index: int) -> Optional[RunCodeUpload]:
+    if record.get("type") != "response_item":
+        return None
+    payload = record.get("payload") or {}
+    if payload.get("type") != "function_call":
+        return None
+    if payload.get("name") != TARGET_RUN_CODE_FN:
+        return None
+    args_raw = payload.get("arguments")
+    args = try_parse_json(args_raw)
+    if not isinstance(args, dict):
+        return None
+    code_value = args.get("code", "")
+    code_str = str("" if code_value is None else code_value)
+    flags_value = args.get("flags", "")
+    if isinstance(flags_value, (list, tuple)):
+        flags_str = "\n".join(str(item) for item in flags_value)
+    else:
+        flags_str = "" if flags_value is None else str(flags_value)
+    return RunCodeUpload(
+        index=index,
+        timestamp=record.get("timestamp", "unknown"),
+        lineno=lineno,
+        code=code_str,
+        flags=str(flags_str),
+    )
 
 
-def build_upload_git_history(uploads: List[RunCodeUpload]) -> List[tuple[str, str]]:
-    if not uploads:
-        return []
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo = Path(tmpdir)
-        git_env = build_git_env()
-        run_git_command(["init", "-q"], repo, git_env)
-        code_path = repo / "code.c"
-        flags_path = repo / "flags.txt"
-        for upload in uploads:
-            code_path.write_text(upload.code, encoding="utf-8")
-            flags_path.write_text(upload.flags, encoding="utf-8")
-            run_git_command(["add", "code.c", "flags.txt"], repo, git_env)
-            commit_message = f"upload {upload.index}"
-            run_git_command(
-                ["commit", "-m", commit_message, "--allow-empty"],
-                repo,
-                git_env,
+def compute_upload_diffs(uploads: List[RunCodeUpload]) -> List[tuple[str, str]]:
+    # Each upload is diffed against the previous one (the first against
+    # nothing), in-process with difflib.
+    diffs: List[tuple[str, str]] = []
+    prev_code: List[str] = []
+    prev_flags: List[str] = []
+    for upload in uploads:
+        code = upload.code.splitlines()
+        flags = upload.flags.splitlines()
+        lines: List[str] = []
+        for name, before, after in (
+            ("code.c", prev_code, code),
+            ("flags.txt", prev_flags, flags),
+        ):
+            lines.extend(
+                difflib.unified_diff(
+                    before,
+                    after,
+                    f"a/{name}" if upload.index > 1 else "/dev/null",
+                    f"b/{name}",
+                    lineterm="",
+                )
             )
-        revs_output = run_git_command(["rev-list", "--reverse", "HEAD"], repo, git_env)
-        revs = [rev for rev in revs_output.strip().splitlines() if rev]
-        diffs: List[tuple[str, str]] = []
-        for rev, upload in zip(revs, uploads):
-            short = run_git_command(["rev-parse", "--short", rev], repo, git_env).strip()
-            diff = run_git_command(["show", "--stat", "--patch", rev], repo, git_env)
-            label = f"{short} · upload {upload.index}"
-            diffs.append((label, diff))
-        return diffs
-
-
-def build_git_env() -> dict:
-    env = os.environ.copy()
-    env.setdefault("GIT_AUTHOR_NAME", "RunCodeLogger")
-    env.setdefault("GIT_AUTHOR_EMAIL", "run-code@example.com")
-    env.setdefault("GIT_COMMITTER_NAME", env["GIT_AUTHOR_NAME"])
-    env.setdefault("GIT_COMMITTER_EMAIL", env["GIT_AUTHOR_EMAIL"])
-    return env
-
-
-def run_git_command(args: List[str], cwd: Path, env: dict) -> str:
-    result = subprocess.run(
-        ["git", *args],
-        cwd=str(cwd),
-        env=env,
-        capture_output=True,
-        text=True,
-        check=False,
+        diffs.append((f"upload {upload.index}", "\n".join(lines)))
+        prev_code = code
+        prev_flags = flags
+    return diffs
+
+
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    501: "Not Implemented",
+}
+
+
+Response = Tuple[int, Sequence[bytes], int]
+
+
+# Both variants of each page are prepared at startup; gzip'd HTML is ~10x smaller.
+Page = Tuple[Response, Response]
+
+
+def build_response(
+    status: int,
+    chunks: Sequence[bytes],
+    content_type: str = "text/html; charset=utf-8",
+    content_encoding: Optional[str] = None,
+    vary: Optional[str] = None,
+) -> Response:
+    length = sum(len(chunk) for chunk in chunks)
+    encoding_header = f"Content-Encoding: {content_encoding}\r\n" if content_encoding else ""
+    vary_header = f"Vary: {vary}\r\n" if vary else ""
+    head = (
+        f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"{encoding_header}"
+        f"{vary_header}"
+        f"Content-Length: {length}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode("latin-1")
+    # Glue the head onto the first body chunk so the status line, headers and
+    # the start of the body leave in one send() instead of two.
+    wire = [head + chunks[0], *chunks[1:]] if chunks else [head]
+    return status, wire, length
+
+
+def build_page_responses(chunks: Sequence[bytes]) -> Page:
+    # Both variants say Vary so caches never hand gzip to a client that
+    # did not ask for it.
+    return (
+        build_response(200, chunks, vary="Accept-Encoding"),
+        build_response(
+            200, gzip_chunks(chunks), content_encoding="gzip", vary="Accept-Encoding"
+        ),
     )
-    if result.returncode != 0:
-        stderr = result.stderr.strip() or "git command failed"
-        raise RuntimeError(f"git {' '.join(args)}: {stderr}")
-    return result.stdout
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> List[bytes]:
+    # Compress chunk by chunk so the page is never joined into one buffer.
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    compressed = [compressor.compress(chunk) for chunk in chunks]
+    compressed.append(compressor.flush())
+    return list(coalesce_chunks(compressed, STREAM_CHUNK_SIZE))
+
+
+def accepts_gzip(header_lines: Iterable[bytes]) -> bool:
+    # The header may be split across several lines; together they form one
+    # comma-separated list.
+    values: List[bytes] = []
+    for line in header_lines:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"accept-encoding":
+            values.append(value)
+    return bool(values) and gzip_quality(b",".join(values)) > 0
+
+
+def gzip_quality(value: bytes) -> float:
+    # An explicit gzip entry wins over "*"; q=0 means the client refuses it.
+    wildcard = 0.0
+    for item in value.lower().split(b","):
+        coding, _, params = item.partition(b";")
+        coding = coding.strip()
+        if coding not in (b"gzip", b"x-gzip", b"*"):
+            continue
+        quality = 1.0
+        for param in params.split(b";"):
+            key, _, number = param.partition(b"=")
+            if key.strip() == b"q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        if coding != b"*":
+            return quality
+        wildcard = quality
+    return wildcard
+
+
+PAYLOAD_PREFIX = "/payload/"
+
+
+def build_payload_response(lineno: str, deferred: Deferred) -> Response:
+    # Rendered per request: a payload is typically opened once, if at all.
+    # The length cap keeps int() clear of its digit limit on hostile paths.
+    if not (lineno.isascii() and lineno.isdigit()) or len(lineno) > 20:
+        return build_error_response(404)
+    payload_id = int(lineno)
+    if payload_id not in deferred:
+        return build_error_response(404)
+    body = pretty_json(deferred[payload_id]).encode("utf-8")
+    return build_response(200, [body], content_type="application/json; charset=utf-8")
+
+
+def build_error_response(status: int) -> Response:
+    reason = HTTP_REASONS[status]
+    body = f"<!doctype html><title>{status} {reason}</title><h1>{status} {reason}</h1>\n"
+    return build_response(status, [body.encode("utf-8")])
+
+
+# A client that stalls mid-request is dropped instead of holding its socket.
+REQUEST_TIMEOUT = 10.0
+MAX_HEADER_LINES = 100
+
+
+async def read_request_head(reader: asyncio.StreamReader) -> List[bytes]:
+    # Lines may end in a bare \n as well as \r\n; blank lines before the
+    # request line are skipped. An oversized head raises ValueError, as
+    # readline() itself does for a line longer than the reader's limit.
+    lines: List[bytes] = []
+    while True:
+        line = await reader.readline()
+        if not line.endswith(b"\n"):
+            raise asyncio.IncompleteReadError(line, None)
+        line = line.rstrip(b"\r\n")
+        if line:
+            if len(lines) > MAX_HEADER_LINES:
+                raise ValueError("too many header lines")
+            lines.append(line)
+        elif lines:
+            return lines
+
+
+async def handle_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    pages: Dict[str, Page],
+    deferred: Deferred,
+) -> None:
+    head: List[bytes] = []
+    try:
+        head = await asyncio.wait_for(read_request_head(reader), REQUEST_TIMEOUT)
+    except ValueError:
+        pass  # Oversized head; answered with 400 below.
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        writer.close()
+        return
+    request_line = head[0].decode("latin-1") if head else ""
+    parts = request_line.split()
+    if len(parts) != 3:
+        response = build_error_response(400)
+    elif parts[0] != "GET":
+        response = build_error_response(501)
+    elif parts[1] in pages:
+        plain, gzipped = pages[parts[1]]
+        response = gzipped if accepts_gzip(head[1:]) else plain
+    elif parts[1].startswith(PAYLOAD_PREFIX):
+        response = build_payload_response(parts[1][len(PAYLOAD_PREFIX):], deferred)
+    else:
+        response = build_error_response(404)
+    status, chunks, length = response
+    try:
+        # Drain after every chunk so the transport never buffers a whole page.
+        for chunk in chunks:
+            writer.write(chunk)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+    # Keep stdout clean; use stderr for concise logs.
+    sys.stderr.write(f'Server: "{request_line}" {status} {length}\n')
 
 
 def start_server(
     port: int,
-    index_builder: Callable[[], str],
-    run_code_builder: Callable[[], str],
+    index_chunks: Sequence[bytes],
+    run_code_chunks: Sequence[bytes],
+    deferred: Deferred,
 ) -> None:
-    class Handler(BaseHTTPRequestHandler):
-        def do_GET(self) -> None:
-            if self.path in {"/", "/index.html"}:
-                body_builder = index_builder
-            elif self.path == "/run_code_log.html":
-                body_builder = run_code_builder
-            else:
-                self.send_error(404, "Not Found")
-                return
-            body = body_builder().encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(body)))
-            self.end_headers()
-            self.wfile.write(body)
+    # Bodies are rendered once at startup, so every response is prebuilt and a
+    # single-threaded event loop only has to copy bytes to sockets.
+    index_page = build_page_responses(index_chunks)
+    pages = {
+        "/": index_page,
+        "/index.html": index_page,
+        "/run_code_log.html": build_page_responses(run_code_chunks),
+    }
 
-        def log_message(self, format: str, *args: object) -> None:
-            # Keep stdout clean; use stderr for concise logs.
-            sys.stderr.write("Server: " + format % args + "\n")
+    async def serve() -> None:
+        server = await asyncio.start_server(
+            lambda reader, writer: handle_connection(reader, writer, pages, deferred),
+            "0.0.0.0",
+            port,
+        )
+        print(f"Serving log on http://127.0.0.1:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
 
-    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
-    print(f"Serving log on http://127.0.0.1:{port}")
-    server.serve_forever()
+    asyncio.run(serve())
 
 
 def main() -> None:
@@ -947,18 +1477,15 @@ def main() -> None:
         print(f"Log file not found: {source_path}", file=sys.stderr)
         sys.exit(1)
 
-    entries = load_entries(source_path)
+    entries, uploads, deferred = load_log(source_path, args.jobs)
     if not entries:
         print("No entries were parsed from the log.", file=sys.stderr)
         sys.exit(1)
 
-    def page_builder() -> str:
-        return build_page(entries, source_path)
-
-    def run_code_builder() -> str:
-        return build_run_code_page(source_path)
-
-    start_server(args.port, page_builder, run_code_builder)
+    index_chunks = build_page(entries, source_path)
+    del entries
+    run_code_chunks = build_run_code_page(uploads, source_path)
+    start_server(args.port, index_chunks, run_code_chunks, deferred)
 
 
 if __name__ == "__main__":